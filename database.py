@@ -2,7 +2,7 @@
 DB 연결/세션/베이스 설정 모듈.
 
 - secrets.json에서 DB 접속 정보를 로드
-- SQLAlchemy 엔진과 세션 팩토리를 생성
+- SQLAlchemy 엔진과 세션 팩토리를 생성 (동기 + 비동기)
 - 모델 베이스(Base)를 노출
 """
 
@@ -10,10 +10,11 @@ import json
 from pathlib import Path
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 
-def load_database_url() -> str:
+def load_database_url(driver: str = "pymysql") -> str:
     """secrets.json에서 MySQL 접속 문자열을 구성."""
 
     secrets_path = Path(__file__).with_name("secrets.json")
@@ -33,17 +34,38 @@ def load_database_url() -> str:
     if not user or not password:
         raise RuntimeError("secrets.json에 user/password가 필요합니다.")
 
-    return f"mysql+pymysql://{user}:{password}@{host}:{port}/{db_name}?charset={charset}"
+    return f"mysql+{driver}://{user}:{password}@{host}:{port}/{db_name}?charset={charset}"
 
 
 # secrets.json 기반 DB URL
 DATABASE_URL = load_database_url()
 
-# 커넥션 풀 엔진 생성 (끊어진 커넥션 자동 복구)
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+# 커넥션 풀 설정 (동기/비동기 엔진 공통)
+# - pool_size/max_overflow: 동시 요청이 소수의 커넥션에 몰려 대기하지 않도록 확장
+#   (엔진 2개 x 워커 수 만큼 MySQL max_connections 여유가 필요)
+# - pool_pre_ping: 끊어진 커넥션 자동 복구
+# - pool_recycle: MySQL wait_timeout 전에 커넥션 재생성
+# 다중 행 INSERT는 드라이버가 처리 (pymysql/aiomysql executemany가 INSERT ... VALUES를
+# 한 문장으로 묶음)하므로 psycopg2 전용 executemany_mode는 설정하지 않음.
+# autocommit도 드라이버 기본값(off)이고 세션이 명시적으로 커밋함.
+POOL_OPTIONS = {
+    "pool_size": 20,
+    "max_overflow": 40,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+
+# 커넥션 풀 엔진 생성
+engine = create_engine(DATABASE_URL, **POOL_OPTIONS)
 
 # 요청 단위로 사용할 세션 팩토리
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔드포인트용 엔진/세션 팩토리 (aiomysql 드라이버)
+ASYNC_DATABASE_URL = load_database_url("aiomysql")
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **POOL_OPTIONS)
+# 커밋 후 속성 접근 시 지연 로딩이 일어나지 않도록 만료하지 않음
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # SQLAlchemy 모델 베이스
 Base = declarative_base()
@@ -6,31 +6,108 @@ FastAPI 진입점.
 """
 
 import asyncio
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional
-
-from fastapi import Depends, FastAPI, HTTPException, Query
-from pydantic import BaseModel, Field, model_validator
-from sqlalchemy import func, text
+import base64
+import hashlib
+import math
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta, timezone
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, List, Optional
+
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from pydantic import AliasChoices, BaseModel, Field, TypeAdapter, ValidationError
+from sqlalchemy import (
+    and_,
+    bindparam,
+    case,
+    delete,
+    exists,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from typing_extensions import TypedDict
 
-from database import Base, SessionLocal, engine
+from database import AsyncSessionLocal, Base, SessionLocal, engine
 from model import DailyStats, Detection, DetectionDetail, TrashCan, WasteType
 
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSON 응답 (표준 json 모듈보다 빠름)."""
+
+    def render(self, content: Any) -> bytes:
+        # by_city처럼 None 키가 있는 dict도 직렬화
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # FastAPI 앱 인스턴스 (자동 문서화 포함)
-app = FastAPI(title="Trash Detection API")
+app = FastAPI(title="Trash Detection API", default_response_class=ORJSONResponse)
 
 # 통계 갱신 주기 (분)
 STATS_INTERVAL_MINUTES = 60
 # 통계 데이터 조회 대기 일수
 STATS_LAG_DAYS = 1
 
+# 탐지 저장 배치 최대 크기 (한 트랜잭션으로 커밋할 요청 수)
+INGEST_BATCH_SIZE = 64
+# 저장 대기 큐 최대 길이 (가득 차면 새 요청이 빈자리를 기다리며 부하를 제한)
+INGEST_QUEUE_SIZE = INGEST_BATCH_SIZE * 4
+
+# YOLO class_id -> waste_type_id 캐시 (프로세스 단위, 커밋된 값만 저장)
+_waste_type_cache: Dict[int, int] = {}
+# trashcan_name -> trashcan_id 캐시 (trashcan_id 없는 요청의 UNKNOWN 조회만 저장)
+# 명시적 trashcan_id는 소프트 삭제 복구를 위해 매번 upsert_trashcan으로 처리
+_trashcan_cache: Dict[str, int] = {}
+
+
+# 조회 응답 캐시 유지 시간 (초, 응답 Cache-Control max-age와 동일)
+RESPONSE_CACHE_TTL_SECONDS = 30
+# 조회 응답 캐시 최대 항목 수 (쿼리 조합마다 항목이 생기므로 LRU로 제한)
+RESPONSE_CACHE_MAX_ENTRIES = 256
+# 경로+쿼리 -> (만료 시각(monotonic), 응답 본문, ETag)
+_response_cache: "OrderedDict[str, tuple]" = OrderedDict()
+# 동기 엔드포인트는 스레드풀에서 동시에 실행되므로 LRU 갱신/제거/무효화를 잠금으로 보호
+_response_cache_lock = Lock()
+# 무효화 세대 (조회 도중 무효화되면 그 조회 결과는 캐시에 저장하지 않음)
+_response_cache_generation = 0
+
+# 하루의 시작/끝 시각 (기간 조회 시 datetime.combine에 사용)
+_T_MIN = time.min
+_T_MAX = time.max
+
+
+def _utcnow() -> datetime:
+    """현재 UTC 시각 (DB의 naive DateTime 컬럼과 비교하도록 tzinfo 제거)."""
+
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# 기존 테이블에 추가로 생성할 인덱스 이름 (create_all은 이미 있는 테이블의 인덱스를 만들지 않음)
+ENSURED_INDEXES = {
+    "ix_Detection_detected_at",
+    "ix_det_trashcan_time",
+    "ix_dd_detection_wastetype",
+    "ix_tc_lat_lng",
+}
+
 
 # =========================
 # 입력 스키마
 # =========================
-class BoxSchema(BaseModel):
-    """바운딩 박스 좌표."""
+class BoxSchema(TypedDict):
+    """바운딩 박스 좌표 (중첩 모델 생성 비용이 없도록 TypedDict 사용)."""
 
     x1: float
     y1: float
@@ -51,24 +128,40 @@ class DetectionIn(BaseModel):
     """탐지 이벤트 입력 스키마 (이미지 단위)."""
 
     trashcan_id: Optional[int] = None
-    image_name: Optional[str] = Field(None, alias="filename")
-    image_path: Optional[str] = Field(None, alias="saved_path")
+    # 입력 키 별칭은 pydantic-core에서 처리 (앞쪽 키가 우선)
+    image_name: Optional[str] = Field(
+        None, validation_alias=AliasChoices("filename", "source_image", "image_name")
+    )
+    image_path: Optional[str] = Field(None, validation_alias=AliasChoices("saved_path", "image_path"))
     detected_at: Optional[datetime] = None
-    total_objects: Optional[int] = Field(None, alias="object_count")
-    predictions: List[PredictionSchema] = Field(default_factory=list, alias="objects")
+    total_objects: Optional[int] = Field(
+        None, validation_alias=AliasChoices("object_count", "total_objects")
+    )
+    predictions: List[PredictionSchema] = Field(
+        default_factory=list, validation_alias=AliasChoices("objects", "predictions")
+    )
 
     class Config:
         validate_by_name = True
 
-    @model_validator(mode="before")
-    def normalize_fields(cls, values: Dict) -> Dict:
-        if "filename" not in values and "source_image" in values:
-            values["filename"] = values["source_image"]
-        if "saved_path" not in values and "image_path" in values:
-            values["saved_path"] = values["image_path"]
-        if "objects" not in values and "predictions" in values:
-            values["objects"] = values["predictions"]
-        return values
+
+# /detections 원본 바디 검증기 (모듈 로드 시 한 번만 생성해 재사용)
+DETECTION_ADAPTER = TypeAdapter(DetectionIn)
+# 원본 바디를 직접 검증하는 /detections의 문서화용 스키마 (하위 모델은 components/schemas에 등록)
+DETECTION_BODY_SCHEMA = DETECTION_ADAPTER.json_schema(ref_template="#/components/schemas/{model}")
+DETECTION_BODY_DEFS = DETECTION_BODY_SCHEMA.pop("$defs", {})
+
+
+def openapi() -> Dict[str, Any]:
+    """기본 OpenAPI 스키마에 /detections 바디의 하위 모델 정의를 추가."""
+
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(DETECTION_BODY_DEFS)
+    return app.openapi_schema
+
+
+app.openapi = openapi
 
 
 class TrashCanIn(BaseModel):
@@ -95,6 +188,23 @@ class TrashCanUpdate(BaseModel):
     is_online: Optional[bool] = None
 
 
+class TrashCanListItem(BaseModel):
+    """쓰레기통 목록 응답 항목 (조회 결과 Row를 속성으로 직접 읽어 검증/직렬화)."""
+
+    model_config = {"from_attributes": True}
+
+    trashcan_id: int
+    trashcan_name: Optional[str] = None
+    total_objects: int
+    current_objects: int
+    capacity_remaining: Optional[int] = None
+    trashcan_city: Optional[str] = None
+    address_detail: Optional[str] = None
+    is_online: Optional[bool] = None
+    last_connected_at: Optional[datetime] = None
+    status: str
+
+
 class WasteTypeIn(BaseModel):
     """쓰레기 종류 등록 입력 스키마."""
 
@@ -114,38 +224,219 @@ def get_db():
         db.close()
 
 
-def get_or_create_trashcan(db: Session, trashcan_id: Optional[int]) -> TrashCan:
+async def get_async_db():
+    """요청마다 비동기 DB 세션을 생성/종료하는 의존성 (쓰기 엔드포인트용)."""
+
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def upsert_trashcan(db: AsyncSession, trashcan_id: Optional[int]) -> int:
+    """쓰레기통을 조회/생성(삭제 상태면 복구)하고 ID를 반환."""
+
     if trashcan_id is not None:
-        trashcan = db.query(TrashCan).filter(TrashCan.trashcan_id == trashcan_id).one_or_none()
-        if trashcan:
-            if trashcan.is_deleted:
-                trashcan.is_deleted = False
-                db.flush()
-            return trashcan
-        trashcan = TrashCan(trashcan_id=trashcan_id, trashcan_name=f"TrashCan {trashcan_id}")
-        db.add(trashcan)
-        db.flush()
-        return trashcan
-    trashcan = db.query(TrashCan).filter(TrashCan.trashcan_name == "UNKNOWN").one_or_none()
-    if trashcan:
-        return trashcan
+        # 없으면 생성, 있으면 소프트 삭제만 해제 (단일 INSERT ... ON DUPLICATE KEY UPDATE)
+        stmt = mysql_insert(TrashCan).values(trashcan_id=trashcan_id, trashcan_name=f"TrashCan {trashcan_id}")
+        await db.execute(stmt.on_duplicate_key_update(is_deleted=False))
+        return trashcan_id
+    result = await db.execute(select(TrashCan.trashcan_id).where(TrashCan.trashcan_name == "UNKNOWN"))
+    unknown_id = result.scalar_one_or_none()
+    if unknown_id is not None:
+        return unknown_id
     trashcan = TrashCan(trashcan_name="UNKNOWN", trashcan_city="UNKNOWN")
     db.add(trashcan)
-    db.flush()
-    return trashcan
-
-
-def get_or_create_waste_type(db: Session, class_id: int, class_name: str) -> WasteType:
-    waste_type = db.query(WasteType).filter(WasteType.waste_type_id == class_id).one_or_none()
-    if waste_type:
-        return waste_type
-    waste_type = db.query(WasteType).filter(WasteType.type_name == class_name).one_or_none()
-    if waste_type:
-        return waste_type
-    waste_type = WasteType(waste_type_id=class_id, type_name=class_name)
-    db.add(waste_type)
-    db.flush()
-    return waste_type
+    await db.flush()
+    return trashcan.trashcan_id
+
+
+def status_case(count: Any, full_threshold: int, medium_threshold: int) -> Any:
+    """탐지 수 컬럼으로 쓰레기통 상태(full/medium/low/unknown)를 계산하는 SQL 식."""
+
+    return case(
+        (count.is_(None), "unknown"),
+        (count >= full_threshold, "full"),
+        (count >= medium_threshold, "medium"),
+        else_="low",
+    )
+
+
+def compute_status(count: Optional[int], full_threshold: int, medium_threshold: int) -> str:
+    """이미 집계된 단일 값의 상태 계산 (status_case와 같은 기준의 Python 버전)."""
+
+    if count is None:
+        return "unknown"
+    if count >= full_threshold:
+        return "full"
+    if count >= medium_threshold:
+        return "medium"
+    return "low"
+
+
+def status_rank(count: Any, full_threshold: int, medium_threshold: int) -> Any:
+    """상태 정렬 순서(full -> medium -> low -> unknown)를 계산하는 SQL 식."""
+
+    return case(
+        (count.is_(None), 3),
+        (count >= full_threshold, 0),
+        (count >= medium_threshold, 1),
+        else_=2,
+    )
+
+
+def filter_trashcans_by_text(query: Any, city: Optional[str], name: Optional[str]) -> Any:
+    """도시/이름 부분 일치(대소문자 무시) 조건을 쿼리에 추가 (LIKE 특수문자는 이스케이프)."""
+
+    if city:
+        query = query.filter(TrashCan.trashcan_city.icontains(city, autoescape=True))
+    if name:
+        query = query.filter(TrashCan.trashcan_name.icontains(name, autoescape=True))
+    return query
+
+
+def encode_cursor(detected_at: datetime, detail_id: int) -> str:
+    """(탐지 시각, 상세 ID) 위치를 다음 페이지 커서 문자열로 변환."""
+
+    return base64.urlsafe_b64encode(f"{detected_at.isoformat()}|{detail_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """커서 문자열을 (탐지 시각, 상세 ID)로 복원 (형식이 잘못되면 400)."""
+
+    try:
+        detected_at, detail_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(detected_at), int(detail_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="invalid cursor") from exc
+
+
+def _response_cache_key(request: Request) -> str:
+    """경로와 (순서 무관한) 쿼리 파라미터로 캐시 키 생성."""
+
+    return f"{request.url.path}?{sorted(request.query_params.multi_items())}"
+
+
+def _cached_body_response(request: Request, body: bytes, etag: str) -> Response:
+    """캐시된 본문으로 응답 (ETag가 같으면 본문 없이 304)."""
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": (
+            f"public, max-age={RESPONSE_CACHE_TTL_SECONDS}, "
+            f"stale-while-revalidate={RESPONSE_CACHE_TTL_SECONDS}"
+        ),
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def get_cached_response(request: Request) -> Optional[Response]:
+    """만료 전 캐시가 있으면 그 응답을, 없으면 None을 반환."""
+
+    key = _response_cache_key(request)
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is None or cached[0] <= monotonic():
+            # 조회를 시작한 세대를 기록해 cache_response에서 비교
+            request.state.response_cache_generation = _response_cache_generation
+            return None
+        _response_cache.move_to_end(key)
+    return _cached_body_response(request, cached[1], cached[2])
+
+
+def cache_response(request: Request, content: Any) -> Response:
+    """응답 내용을 직렬화해 RESPONSE_CACHE_TTL_SECONDS 동안 캐시하고 응답.
+
+    get_cached_response 이후 무효화가 있었다면 쓰기 전 데이터일 수 있으므로 저장하지 않음.
+    """
+
+    body = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    key = _response_cache_key(request)
+    with _response_cache_lock:
+        if request.state.response_cache_generation == _response_cache_generation:
+            _response_cache[key] = (monotonic() + RESPONSE_CACHE_TTL_SECONDS, body, etag)
+            _response_cache.move_to_end(key)
+            if len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                _response_cache.popitem(last=False)
+    return _cached_body_response(request, body, etag)
+
+
+def invalidate_response_cache() -> None:
+    """쓰기 후 캐시된 조회 응답을 모두 비우고 세대를 올림 (진행 중인 조회의 이전 결과 저장 방지)."""
+
+    global _response_cache_generation
+    with _response_cache_lock:
+        _response_cache.clear()
+        _response_cache_generation += 1
+
+
+async def resolve_waste_type_ids(db: AsyncSession, predictions: List[PredictionSchema]) -> Dict[int, int]:
+    """예측 class_id -> waste_type_id 매핑을 일괄 조회/생성."""
+
+    resolved: Dict[int, int] = {}
+    names = {}
+    for pred in predictions:
+        if pred.class_id in _waste_type_cache:
+            resolved[pred.class_id] = _waste_type_cache[pred.class_id]
+        else:
+            names.setdefault(pred.class_id, pred.class_name)
+    if not names:
+        return resolved
+
+    # 캐시에 없는 class_id만 한 번에 조회
+    result = await db.execute(select(WasteType.waste_type_id).where(WasteType.waste_type_id.in_(names)))
+    resolved.update((waste_type_id, waste_type_id) for waste_type_id in result.scalars())
+    # 없는 class_id는 이름으로 한 번 더 조회
+    missing = {class_id: name for class_id, name in names.items() if class_id not in resolved}
+    if missing:
+        result = await db.execute(
+            select(WasteType.waste_type_id, WasteType.type_name).where(
+                WasteType.type_name.in_(set(missing.values()))
+            )
+        )
+        by_name = {type_name: waste_type_id for waste_type_id, type_name in result}
+        for class_id, name in list(missing.items()):
+            if name in by_name:
+                resolved[class_id] = by_name[name]
+                del missing[class_id]
+    # 남은 종류는 한 번에 생성 (같은 이름은 먼저 나온 class_id로 통일)
+    if missing:
+        created: Dict[str, int] = {}
+        for class_id, name in missing.items():
+            created.setdefault(name, class_id)
+        # 동시 요청이 먼저 생성한 경우에도 실패하지 않도록 중복 키는 무시
+        stmt = mysql_insert(WasteType).values(
+            [{"waste_type_id": class_id, "type_name": name} for name, class_id in created.items()]
+        )
+        await db.execute(stmt.on_duplicate_key_update(waste_type_id=WasteType.waste_type_id))
+        # 실제로 저장된 ID를 이름 기준으로 확정
+        result = await db.execute(
+            select(WasteType.waste_type_id, WasteType.type_name).where(WasteType.type_name.in_(created))
+        )
+        by_name = {type_name: waste_type_id for waste_type_id, type_name in result}
+        for class_id, name in missing.items():
+            resolved[class_id] = by_name.get(name, created[name])
+    return resolved
+
+
+def prime_lookup_caches() -> None:
+    """등록된 쓰레기 종류/쓰레기통 ID로 캐시를 미리 채움."""
+
+    with SessionLocal() as db:
+        _waste_type_cache.update(
+            (waste_type_id, waste_type_id) for (waste_type_id,) in db.query(WasteType.waste_type_id)
+        )
+        unknown_id = db.query(TrashCan.trashcan_id).filter(TrashCan.trashcan_name == "UNKNOWN").scalar()
+        if unknown_id is not None:
+            _trashcan_cache["UNKNOWN"] = unknown_id
+
+
+def clear_lookup_caches() -> None:
+    """캐시된 ID가 다른 곳에서 삭제되었을 수 있을 때 캐시를 비움."""
+
+    _waste_type_cache.clear()
+    _trashcan_cache.clear()
 
 
 def ensure_trashcan_schema() -> None:
@@ -172,53 +463,273 @@ def ensure_trashcan_schema() -> None:
             )
 
 
+def ensure_detail_bbox_columns() -> None:
+    """bbox 좌표 컬럼이 없으면 추가하고 기존 bbox_info(JSON) 값으로 채움."""
+
+    with engine.begin() as conn:
+        result = conn.execute(
+            text(
+                """
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_schema = DATABASE()
+                  AND table_name = 'Detection_detail'
+                  AND column_name IN ('bbox_x1', 'bbox_info')
+                """
+            )
+        )
+        columns = {row[0] for row in result}
+        if "bbox_x1" in columns:
+            return
+        conn.execute(
+            text(
+                "ALTER TABLE `Detection_detail` "
+                "ADD COLUMN `bbox_x1` DOUBLE NULL, ADD COLUMN `bbox_y1` DOUBLE NULL, "
+                "ADD COLUMN `bbox_x2` DOUBLE NULL, ADD COLUMN `bbox_y2` DOUBLE NULL"
+            )
+        )
+        # 기존 데이터 보존을 위해 bbox_info 컬럼은 삭제하지 않음
+        if "bbox_info" in columns:
+            conn.execute(
+                text(
+                    """
+                    UPDATE `Detection_detail`
+                    SET bbox_x1 = JSON_EXTRACT(bbox_info, '$.x1'),
+                        bbox_y1 = JSON_EXTRACT(bbox_info, '$.y1'),
+                        bbox_x2 = JSON_EXTRACT(bbox_info, '$.x2'),
+                        bbox_y2 = JSON_EXTRACT(bbox_info, '$.y2')
+                    WHERE bbox_info IS NOT NULL
+                    """
+                )
+            )
+
+
+def ensure_float_columns() -> None:
+    """이전 버전의 DECIMAL 좌표/신뢰도 컬럼을 DOUBLE/FLOAT로 변경."""
+
+    # 테이블 -> (컬럼, 변경할 타입)
+    targets = {
+        "TrashCan": (("trashcan_latitude", "DOUBLE"), ("trashcan_longitude", "DOUBLE")),
+        "Detection_detail": (("confidence", "FLOAT"),),
+    }
+    with engine.begin() as conn:
+        for table_name, columns in targets.items():
+            result = conn.execute(
+                text(
+                    """
+                    SELECT column_name
+                    FROM information_schema.columns
+                    WHERE table_schema = DATABASE()
+                      AND table_name = :table_name
+                      AND data_type = 'decimal'
+                    """
+                ),
+                {"table_name": table_name},
+            )
+            decimal_columns = {row[0] for row in result}
+            changes = [
+                f"MODIFY COLUMN `{column}` {column_type} NULL"
+                for column, column_type in columns
+                if column in decimal_columns
+            ]
+            if changes:
+                # 테이블 재작성이 일어나므로 컬럼 변경은 한 문장으로 처리
+                conn.execute(text(f"ALTER TABLE `{table_name}` " + ", ".join(changes)))
+
+
+def ensure_indexes() -> None:
+    """기존 테이블에 나중에 추가된 인덱스(ENSURED_INDEXES)가 없으면 생성."""
+
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name not in ENSURED_INDEXES:
+                    continue
+                result = conn.execute(
+                    text(
+                        """
+                        SELECT COUNT(*) AS cnt
+                        FROM information_schema.statistics
+                        WHERE table_schema = DATABASE()
+                          AND table_name = :table_name
+                          AND index_name = :index_name
+                        """
+                    ),
+                    {"table_name": table.name, "index_name": index.name},
+                )
+                if not result.scalar():
+                    index.create(conn)
+
+
 # =========================
-# 일별 통계 스케줄러
+# 탐지 저장 배치 처리
 # =========================
-def upsert_daily_stats(
-    db: Session,
-    stats_date: date,
-    trashcan_city: str,
-    waste_type_id: int,
-    detection_count: int,
-) -> None:
-    row = (
-        db.query(DailyStats)
-        .filter(
-            DailyStats.stats_date == stats_date,
-            DailyStats.trashcan_city == trashcan_city,
-            DailyStats.waste_type_id == waste_type_id,
-        )
-        .one_or_none()
+async def store_detections(db: AsyncSession, payloads: List[DetectionIn]) -> List[dict]:
+    """여러 탐지 이벤트를 한 트랜잭션으로 저장하고 요청별 결과를 반환."""
+
+    # 배치 전체의 예측 종류와 쓰레기통을 한 번씩만 확인 (캐시된 종류/UNKNOWN은 생략)
+    waste_type_ids = await resolve_waste_type_ids(
+        db, [pred for payload in payloads for pred in payload.predictions]
     )
-    if row:
-        row.detection_count = detection_count
-    else:
-        db.add(
-            DailyStats(
-                stats_date=stats_date,
-                trashcan_city=trashcan_city,
-                waste_type_id=waste_type_id,
-                detection_count=detection_count,
+    trashcan_ids: Dict[Optional[int], int] = {}
+    for payload in payloads:
+        if payload.trashcan_id in trashcan_ids:
+            continue
+        if payload.trashcan_id is None and "UNKNOWN" in _trashcan_cache:
+            trashcan_ids[None] = _trashcan_cache["UNKNOWN"]
+        else:
+            trashcan_ids[payload.trashcan_id] = await upsert_trashcan(db, payload.trashcan_id)
+
+    # 이미지 단위 이벤트 저장
+    detections = []
+    for payload in payloads:
+        # total_objects가 없으면 predictions 길이로 계산
+        total_objects = payload.total_objects
+        if total_objects is None:
+            total_objects = len(payload.predictions)
+        detections.append(
+            Detection(
+                trashcan_id=trashcan_ids[payload.trashcan_id],
+                image_name=payload.image_name,
+                image_path=payload.image_path,
+                # 탐지 시각이 없으면 현재 시각으로 대체
+                detected_at=payload.detected_at or _utcnow(),
+                object_count=total_objects,
             )
         )
+    # MySQL은 INSERT ... RETURNING과 INSERT를 담은 CTE를 지원하지 않으므로
+    # 이벤트 ID를 flush로 받은 뒤 상세를 별도 INSERT로 저장 (같은 트랜잭션)
+    db.add_all(detections)
+    await db.flush()
+
+    # 예측 객체들을 한 번에 저장
+    rows = [
+        {
+            "detection_id": detection.detection_id,
+            "waste_type_id": waste_type_ids[pred.class_id],
+            "confidence": pred.confidence,
+            "bbox_x1": pred.box["x1"],
+            "bbox_y1": pred.box["y1"],
+            "bbox_x2": pred.box["x2"],
+            "bbox_y2": pred.box["y2"],
+        }
+        for payload, detection in zip(payloads, detections)
+        for pred in payload.predictions
+    ]
+    if rows:
+        # aiomysql의 executemany는 INSERT ... VALUES를 다중 행 한 문장으로 묶어 전송
+        # (psycopg2의 executemany_mode 같은 별도 엔진 설정이 필요 없음)
+        # render_nulls: None 값이 있는 행도 배치가 나뉘지 않도록 NULL로 그대로 전달
+        await db.execute(insert(DetectionDetail).execution_options(render_nulls=True), rows)
+
+    # 트랜잭션 커밋
+    await db.commit()
+    _waste_type_cache.update(waste_type_ids)
+    if None in trashcan_ids:
+        _trashcan_cache["UNKNOWN"] = trashcan_ids[None]
+    return [
+        {"detection_id": detection.detection_id, "total_objects": detection.object_count}
+        for detection in detections
+    ]
+
 
+async def write_detection_batch(batch: List[tuple], retry: bool = True) -> None:
+    """배치를 저장하고 각 요청의 future에 결과를 전달."""
 
+    try:
+        async with AsyncSessionLocal() as db:
+            results = await store_detections(db, [payload for payload, _ in batch])
+    except Exception:
+        if not retry:
+            raise
+        # 캐시된 ID가 다른 곳에서 삭제되었을 수 있으므로 캐시를 비우고 한 번 더 시도
+        clear_lookup_caches()
+        if len(batch) == 1:
+            await write_detection_batch(batch, retry=False)
+            return
+        # 한 요청의 오류가 배치 전체를 실패시키지 않도록 개별 저장으로 재시도
+        for item in batch:
+            try:
+                await write_detection_batch([item], retry=False)
+            except Exception as exc:
+                if not item[1].done():
+                    item[1].set_exception(exc)
+        return
+    for (_, future), result in zip(batch, results):
+        # 클라이언트가 연결을 끊어 취소된 요청은 건너뜀
+        if not future.done():
+            future.set_result(result)
+
+
+async def ingest_worker(queue: asyncio.Queue) -> None:
+    """큐에 쌓인 탐지 요청을 최대 INGEST_BATCH_SIZE개씩 묶어 저장."""
+
+    while True:
+        batch = [await queue.get()]
+        # 이전 배치를 저장하는 동안 쌓인 요청을 대기 없이 함께 가져옴
+        while len(batch) < INGEST_BATCH_SIZE:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        try:
+            await write_detection_batch(batch)
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+# =========================
+# 일별 통계 스케줄러
+# =========================
 def refresh_daily_stats(target_date: date) -> None:
+    """target_date의 일별 통계를 DB 안에서 한 번에 재계산."""
+
+    start_dt = datetime.combine(target_date, _T_MIN)
+    counts = (
+        select(
+            literal(target_date).label("stats_date"),
+            TrashCan.trashcan_city,
+            DetectionDetail.waste_type_id,
+            func.count().label("detection_count"),
+        )
+        .join(Detection, Detection.trashcan_id == TrashCan.trashcan_id)
+        .join(DetectionDetail, DetectionDetail.detection_id == Detection.detection_id)
+        # detected_at 인덱스를 쓸 수 있도록 함수 대신 반열린 구간으로 비교
+        .where(Detection.detected_at >= start_dt, Detection.detected_at < start_dt + timedelta(days=1))
+        .group_by(TrashCan.trashcan_city, DetectionDetail.waste_type_id)
+    )
     with SessionLocal() as db:
-        rows = (
-            db.query(TrashCan.trashcan_city, DetectionDetail.waste_type_id, func.count())
-            .join(Detection, Detection.trashcan_id == TrashCan.trashcan_id)
-            .join(DetectionDetail, DetectionDetail.detection_id == Detection.detection_id)
-            .filter(func.date(Detection.detected_at) == target_date)
-            .group_by(TrashCan.trashcan_city, DetectionDetail.waste_type_id)
-            .all()
+        # 해당 일자 통계를 교체 (NULL 도시도 중복 없이 갱신)
+        db.execute(delete(DailyStats).where(DailyStats.stats_date == target_date))
+        db.execute(
+            insert(DailyStats).from_select(
+                ["stats_date", "trashcan_city", "waste_type_id", "detection_count"],
+                counts,
+            )
         )
-        for trashcan_city, waste_type_id, detection_count in rows:
-            upsert_daily_stats(db, target_date, trashcan_city, waste_type_id, detection_count)
         db.commit()
 
 
+def uncovered_spans(start: date, end: date, covered: set) -> List[tuple]:
+    """start~end 중 covered에 없는 날짜를 연속 구간 [시작일, 끝 다음날) 목록으로 반환."""
+
+    spans: List[tuple] = []
+    day = start
+    while day <= end:
+        if day not in covered:
+            if spans and spans[-1][1] == day:
+                spans[-1] = (spans[-1][0], day + timedelta(days=1))
+            else:
+                spans.append((day, day + timedelta(days=1)))
+        day += timedelta(days=1)
+    return spans
+
+
 def refresh_daily_stats_range(start_date: date, end_date: date) -> None:
     current = start_date
     while current <= end_date:
@@ -226,11 +737,18 @@ def refresh_daily_stats_range(start_date: date, end_date: date) -> None:
         current += timedelta(days=1)
 
 
-async def stats_scheduler() -> None:
+async def stats_scheduler(executor: ThreadPoolExecutor) -> None:
+    loop = asyncio.get_running_loop()
+    today: Optional[date] = None
     while True:
-        target_date = (datetime.utcnow() - timedelta(days=STATS_LAG_DAYS)).date()
+        # 날짜가 바뀐 경우에만 갱신 대상 일자를 다시 계산
+        now = _utcnow()
+        if now.date() != today:
+            today = now.date()
+            target_date = (now - timedelta(days=STATS_LAG_DAYS)).date()
         try:
-            refresh_daily_stats(target_date)
+            # 통계 쿼리가 이벤트 루프를 막지 않도록 전용 스레드에서 실행
+            await loop.run_in_executor(executor, refresh_daily_stats, target_date)
         except Exception:
             # 스케줄러 실패가 서버를 죽이지 않도록 보호
             pass
@@ -239,79 +757,152 @@ async def stats_scheduler() -> None:
 
 @app.on_event("startup")
 async def on_startup() -> None:
-    """앱 시작 시 테이블 자동 생성 및 스케줄러 시작."""
+    """앱 시작 시 테이블 자동 생성, 탐지 저장 워커 및 스케줄러 시작."""
 
     Base.metadata.create_all(bind=engine)
     ensure_trashcan_schema()
-    app.state.stats_task = asyncio.create_task(stats_scheduler())
+    ensure_detail_bbox_columns()
+    ensure_float_columns()
+    ensure_indexes()
+    prime_lookup_caches()
+    app.state.ingest_queue = asyncio.Queue(maxsize=INGEST_QUEUE_SIZE)
+    app.state.ingest_task = asyncio.create_task(ingest_worker(app.state.ingest_queue))
+    # 통계 갱신 전용 스레드 (느린 집계가 기본 실행기를 점유하지 않도록 1개로 제한)
+    # 종료 시 shutdown되므로 재시작마다 새로 생성
+    app.state.stats_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="daily-stats")
+    app.state.stats_task = asyncio.create_task(stats_scheduler(app.state.stats_executor))
 
 
 @app.on_event("shutdown")
 async def on_shutdown() -> None:
-    """스케줄러 종료."""
+    """저장 대기 중인 탐지를 마저 처리한 뒤 스케줄러 및 통계 스레드 종료."""
 
+    queue = getattr(app.state, "ingest_queue", None)
+    if queue:
+        await queue.join()
+        app.state.ingest_task.cancel()
     task = getattr(app.state, "stats_task", None)
     if task:
         task.cancel()
+    executor = getattr(app.state, "stats_executor", None)
+    if executor:
+        executor.shutdown(wait=False)
+
+
+# =========================
+# 조회 쿼리 (모듈 로드 시 한 번만 구성, 요청마다 파라미터만 바인딩)
+# =========================
+_Q_TOTAL_EVENTS = select(func.count(Detection.detection_id))
+_Q_TYPE_COUNTS = (
+    select(WasteType.type_name, func.count(DetectionDetail.detail_id))
+    .join(DetectionDetail, WasteType.waste_type_id == DetectionDetail.waste_type_id)
+    .group_by(WasteType.type_name)
+)
+# 엔티티 대신 응답에 필요한 컬럼만 조회 (identity map/관계 설정 비용 없음)
+_Q_ACTIVE_TRASHCANS = select(TrashCan.trashcan_id, TrashCan.trashcan_name, TrashCan.trashcan_city).where(
+    TrashCan.is_deleted.is_(False)
+)
+_Q_OFFLINE = _Q_ACTIVE_TRASHCANS.add_columns(TrashCan.last_connected_at).where(TrashCan.is_online.is_(False))
+# 쓰레기통별 이벤트/객체 수 (탐지 상세가 없는 이벤트도 세도록 외부 조인 후 한 번에 집계)
+_trashcan_totals = (
+    select(
+        Detection.trashcan_id,
+        func.count(func.distinct(Detection.detection_id)).label("events"),
+        func.count(DetectionDetail.detail_id).label("objects"),
+    )
+    .outerjoin(DetectionDetail, DetectionDetail.detection_id == Detection.detection_id)
+    .group_by(Detection.trashcan_id)
+    .subquery()
+)
+# 쓰레기통 x 종류별 객체 수
+_trashcan_types = (
+    select(Detection.trashcan_id, WasteType.type_name, func.count(DetectionDetail.detail_id).label("objects"))
+    .join(DetectionDetail, DetectionDetail.detection_id == Detection.detection_id)
+    .join(WasteType, WasteType.waste_type_id == DetectionDetail.waste_type_id)
+    .group_by(Detection.trashcan_id, WasteType.type_name)
+    .subquery()
+)
+# 쓰레기통별 요약을 한 번의 조회로 (쓰레기통당 종류 수만큼 행, 종류가 없으면 한 행)
+_Q_TRASHCAN_SUMMARY = (
+    _Q_ACTIVE_TRASHCANS.add_columns(
+        func.coalesce(_trashcan_totals.c.events, 0),
+        func.coalesce(_trashcan_totals.c.objects, 0),
+        _trashcan_types.c.type_name,
+        _trashcan_types.c.objects,
+    )
+    .outerjoin(_trashcan_totals, _trashcan_totals.c.trashcan_id == TrashCan.trashcan_id)
+    .outerjoin(_trashcan_types, _trashcan_types.c.trashcan_id == TrashCan.trashcan_id)
+    .order_by(TrashCan.trashcan_id)
+)
+# 기간 조건은 start_dt/end_dt 바인드 파라미터로 전달
+_Q_PERIOD_EVENTS = select(func.count(Detection.detection_id)).where(
+    Detection.detected_at.between(bindparam("start_dt"), bindparam("end_dt"))
+)
+# 도시 x 종류 집계 (원본 테이블 기준, 기간 조건은 요청마다 추가)
+_Q_LIVE_GROUPS = (
+    select(TrashCan.trashcan_city, WasteType.type_name, func.count(DetectionDetail.detail_id))
+    .join(Detection, Detection.trashcan_id == TrashCan.trashcan_id)
+    .join(DetectionDetail, DetectionDetail.detection_id == Detection.detection_id)
+    .join(WasteType, WasteType.waste_type_id == DetectionDetail.waste_type_id)
+    .group_by(TrashCan.trashcan_city, WasteType.type_name)
+)
+# 도시 x 종류 집계 (DailyStats 기준, stats_start/stats_end 일자 범위)
+_Q_STATS_GROUPS = (
+    select(DailyStats.trashcan_city, WasteType.type_name, func.sum(DailyStats.detection_count))
+    .join(WasteType, WasteType.waste_type_id == DailyStats.waste_type_id)
+    .where(DailyStats.stats_date.between(bindparam("stats_start"), bindparam("stats_end")))
+    .group_by(DailyStats.trashcan_city, WasteType.type_name)
+)
+_Q_STATS_DATES = (
+    select(DailyStats.stats_date)
+    .where(DailyStats.stats_date.between(bindparam("stats_start"), bindparam("stats_end")))
+    .distinct()
+)
 
 
 # =========================
 # API 엔드포인트
 # =========================
+# 헬스체크 응답 본문 (매 요청 직렬화 없이 그대로 전송)
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
 @app.get("/health")
-def health() -> dict:
+async def health() -> Response:
     """헬스체크."""
 
-    return {"status": "ok"}
+    # 미들웨어가 헤더를 바꿀 수 있으므로 응답 객체는 요청마다 생성 (본문만 재사용)
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
-@app.post("/detections")
-def create_detection(payload: DetectionIn, db: Session = Depends(get_db)) -> dict:
+@app.post(
+    "/detections",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": DETECTION_BODY_SCHEMA}},
+        }
+    },
+)
+async def create_detection(request: Request) -> dict:
     """탐지 이벤트를 저장하고 생성된 ID를 반환."""
 
-    # 탐지 시각이 없으면 현재 시각으로 대체
-    detected_at = payload.detected_at or datetime.utcnow()
-    # total_objects가 없으면 predictions 길이로 계산
-    total_objects = payload.total_objects
-    if total_objects is None:
-        total_objects = len(payload.predictions)
-
-    trashcan = get_or_create_trashcan(db, payload.trashcan_id)
-
-    # 이미지 단위 이벤트 저장
-    detection = Detection(
-        trashcan_id=trashcan.trashcan_id,
-        image_name=payload.image_name,
-        image_path=payload.image_path,
-        detected_at=detected_at,
-        object_count=total_objects,
-    )
-    db.add(detection)
-    db.flush()
-
-    # 예측 객체들을 개별로 저장
-    for pred in payload.predictions:
-        waste_type = get_or_create_waste_type(db, pred.class_id, pred.class_name)
-        obj = DetectionDetail(
-            detection_id=detection.detection_id,
-            waste_type_id=waste_type.waste_type_id,
-            confidence=pred.confidence,
-            bbox_info={
-                "x1": pred.box.x1,
-                "y1": pred.box.y1,
-                "x2": pred.box.x2,
-                "y2": pred.box.y2,
-            },
-        )
-        db.add(obj)
+    # JSON 파싱과 검증을 pydantic-core에서 한 번에 수행 (중간 dict 생성 없음)
+    try:
+        payload = DETECTION_ADAPTER.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        ) from exc
 
-    # 트랜잭션 커밋
-    db.commit()
-    return {"detection_id": detection.detection_id, "total_objects": total_objects}
+    # 요청을 배치 큐에 넣고 저장 결과를 기다림
+    future = asyncio.get_running_loop().create_future()
+    await app.state.ingest_queue.put((payload, future))
+    return await future
 
 
 @app.post("/trashcans")
-def create_trashcan(payload: TrashCanIn, db: Session = Depends(get_db)) -> dict:
+async def create_trashcan(payload: TrashCanIn, db: AsyncSession = Depends(get_async_db)) -> dict:
     """쓰레기통 등록."""
 
     trashcan = TrashCan(
@@ -324,12 +915,12 @@ def create_trashcan(payload: TrashCanIn, db: Session = Depends(get_db)) -> dict:
         is_online=payload.is_online,
     )
     db.add(trashcan)
-    db.commit()
-    db.refresh(trashcan)
+    await db.commit()
+    invalidate_response_cache()
     return {"trashcan_id": trashcan.trashcan_id}
 
 
-@app.get("/trashcans")
+@app.get("/trashcans", response_model=List[TrashCanListItem])
 def list_trashcans(
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
@@ -344,85 +935,59 @@ def list_trashcans(
     city: Optional[str] = Query(None),
     name: Optional[str] = Query(None),
     db: Session = Depends(get_db),
-) -> List[dict]:
+):
     """쓰레기통 검색/정렬 목록 조회 (offset 기반 페이지네이션)."""
 
-    def compute_status(current: Optional[int]) -> str:
-        if current is None:
-            return "unknown"
-        if current >= full_threshold:
-            return "full"
-        if current >= medium_threshold:
-            return "medium"
-        return "low"
-
-    status_order = {"full": 0, "medium": 1, "low": 2, "unknown": 3}
-
-    total_rows = (
-        db.query(Detection.trashcan_id, func.count(DetectionDetail.detail_id))
+    # 전체/기간 내 탐지 수를 한 번의 스캔으로 함께 집계
+    cutoff = _utcnow() - timedelta(days=window_days)
+    volumes = (
+        select(
+            Detection.trashcan_id,
+            func.count(DetectionDetail.detail_id).label("total"),
+            # SUM(CASE ...)는 MySQL에서 DECIMAL이므로 정수를 돌려주는 COUNT(CASE ...)로 집계
+            func.count(case((Detection.detected_at >= cutoff, DetectionDetail.detail_id))).label("window"),
+        )
         .join(DetectionDetail, DetectionDetail.detection_id == Detection.detection_id)
         .group_by(Detection.trashcan_id)
-        .all()
+        .subquery()
     )
-    total_map = {trashcan_id: count for trashcan_id, count in total_rows}
-
-    cutoff = datetime.utcnow() - timedelta(days=window_days)
-    window_rows = (
-        db.query(Detection.trashcan_id, func.count(DetectionDetail.detail_id))
-        .join(DetectionDetail, DetectionDetail.detection_id == Detection.detection_id)
-        .filter(Detection.detected_at >= cutoff)
-        .group_by(Detection.trashcan_id)
-        .all()
+    total_objects = func.coalesce(volumes.c.total, 0)
+    current_objects = func.coalesce(volumes.c.window, 0)
+    capacity_remaining = TrashCan.trashcan_capacity - current_objects
+
+    # 필터/집계/정렬/페이지네이션을 모두 SQL에서 처리
+    stmt = (
+        select(
+            TrashCan.trashcan_id,
+            TrashCan.trashcan_name,
+            total_objects.label("total_objects"),
+            current_objects.label("current_objects"),
+            capacity_remaining.label("capacity_remaining"),
+            TrashCan.trashcan_city,
+            TrashCan.address_detail,
+            TrashCan.is_online,
+            TrashCan.last_connected_at,
+            status_case(current_objects, full_threshold, medium_threshold).label("status"),
+        )
+        .outerjoin(volumes, volumes.c.trashcan_id == TrashCan.trashcan_id)
+        .where(TrashCan.is_deleted.is_(False))
     )
-    window_map = {trashcan_id: count for trashcan_id, count in window_rows}
+    if is_online is not None:
+        stmt = stmt.where(TrashCan.is_online.is_(is_online))
+    stmt = filter_trashcans_by_text(stmt, city, name)
 
-    rows = db.query(TrashCan).filter(TrashCan.is_deleted.is_(False)).all()
-    items = []
-    for row in rows:
-        if is_online is not None and row.is_online is not is_online:
-            continue
-        if city:
-            if row.trashcan_city is None or city.lower() not in row.trashcan_city.lower():
-                continue
-        if name and (row.trashcan_name is None or name.lower() not in row.trashcan_name.lower()):
-            continue
-        total_objects = total_map.get(row.trashcan_id, 0)
-        current_objects = window_map.get(row.trashcan_id, 0)
-        capacity_remaining = None
-        if row.trashcan_capacity is not None:
-            capacity_remaining = row.trashcan_capacity - current_objects
-        items.append(
-            {
-                "trashcan_id": row.trashcan_id,
-                "trashcan_name": row.trashcan_name,
-                "total_objects": total_objects,
-                "current_objects": current_objects,
-                "capacity_remaining": capacity_remaining,
-                "trashcan_city": row.trashcan_city,
-                "address_detail": row.address_detail,
-                "is_online": row.is_online,
-                "last_connected_at": row.last_connected_at,
-                "status": compute_status(current_objects),
-            }
-        )
-    if sort == "total_asc":
-        items.sort(key=lambda item: item["total_objects"])
-    elif sort == "capacity_remaining_desc":
-        items.sort(
-            key=lambda item: (
-                item["capacity_remaining"] is None,
-                -(item["capacity_remaining"] or 0),
-            )
-        )
-    elif sort == "capacity_remaining_asc":
-        items.sort(key=lambda item: (item["capacity_remaining"] is None, item["capacity_remaining"] or 0))
-    elif sort == "status_desc":
-        items.sort(key=lambda item: (status_order.get(item["status"], 9), -(item["current_objects"] or 0)))
-    elif sort == "status_asc":
-        items.sort(key=lambda item: (status_order.get(item["status"], 9), item["current_objects"] or 0))
-    else:
-        items.sort(key=lambda item: -item["total_objects"])
-    return items[offset : offset + limit]
+    rank = status_rank(current_objects, full_threshold, medium_threshold)
+    order_by = {
+        "total_asc": (total_objects,),
+        "capacity_remaining_desc": (capacity_remaining.is_(None), capacity_remaining.desc()),
+        "capacity_remaining_asc": (capacity_remaining.is_(None), capacity_remaining),
+        "status_desc": (rank, current_objects.desc()),
+        "status_asc": (rank, current_objects),
+    }.get(sort, (total_objects.desc(),))
+    stmt = stmt.order_by(*order_by, TrashCan.trashcan_id).offset(offset).limit(limit)
+
+    # Row를 그대로 반환하면 response_model이 속성 접근으로 검증/직렬화 (중간 dict 생성 없음)
+    return db.execute(stmt).all()
 
 
 @app.get("/trashcans/locations")
@@ -431,26 +996,44 @@ def trashcan_locations(
     limit: int = Query(200, ge=1, le=500),
     city: Optional[str] = Query(None),
     name: Optional[str] = Query(None),
+    bbox: Optional[str] = Query(None, description="지도 영역 lat1,lng1,lat2,lng2"),
     db: Session = Depends(get_db),
-) -> dict:
+) -> Response:
     """지도용 쓰레기통 위치 조회."""
 
     query = (
-        db.query(TrashCan)
+        db.query(
+            TrashCan.trashcan_id,
+            TrashCan.trashcan_name,
+            TrashCan.trashcan_city,
+            TrashCan.address_detail,
+            TrashCan.trashcan_latitude,
+            TrashCan.trashcan_longitude,
+        )
         .filter(
             TrashCan.is_deleted.is_(False),
             TrashCan.trashcan_latitude.is_not(None),
             TrashCan.trashcan_longitude.is_not(None),
         )
     )
-    rows = query.all()
+    if bbox:
+        try:
+            lat1, lng1, lat2, lng2 = (float(value) for value in bbox.split(","))
+            # nan/inf는 float()가 받아들이지만 MySQL에 바인드할 수 없음
+            if not all(math.isfinite(value) for value in (lat1, lng1, lat2, lng2)):
+                raise ValueError(bbox)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail="bbox must be lat1,lng1,lat2,lng2") from exc
+        # (위도, 경도) 인덱스로 영역 안의 쓰레기통만 범위 조회
+        query = query.filter(
+            TrashCan.trashcan_latitude.between(min(lat1, lat2), max(lat1, lat2)),
+            TrashCan.trashcan_longitude.between(min(lng1, lng2), max(lng1, lng2)),
+        )
+    # 필요한 페이지만 DB에서 가져옴 (trashcan_id 순서로 고정)
+    query = filter_trashcans_by_text(query, city, name).order_by(TrashCan.trashcan_id)
+    rows = query.offset(offset).limit(limit).all()
     items = []
     for row in rows:
-        if city:
-            if row.trashcan_city is None or city.lower() not in row.trashcan_city.lower():
-                continue
-        if name and (row.trashcan_name is None or name.lower() not in row.trashcan_name.lower()):
-            continue
         items.append(
             {
                 "trashcan_id": row.trashcan_id,
@@ -461,17 +1044,17 @@ def trashcan_locations(
                 "trashcan_longitude": row.trashcan_longitude,
             }
         )
-    return {"items": items[offset : offset + limit]}
+    return ORJSONResponse(content={"items": items})
 
 
 @app.patch("/trashcans/{trashcan_id}")
-def update_trashcan(trashcan_id: int, payload: TrashCanUpdate, db: Session = Depends(get_db)) -> dict:
+async def update_trashcan(
+    trashcan_id: int, payload: TrashCanUpdate, db: AsyncSession = Depends(get_async_db)
+) -> dict:
     """쓰레기통 이름/주소 수정."""
 
-    trashcan = (
-        db.query(TrashCan)
-        .filter(TrashCan.trashcan_id == trashcan_id, TrashCan.is_deleted.is_(False))
-        .one_or_none()
+    trashcan = await db.scalar(
+        select(TrashCan).where(TrashCan.trashcan_id == trashcan_id, TrashCan.is_deleted.is_(False))
     )
     if not trashcan:
         return {"updated": False, "reason": "not_found"}
@@ -491,7 +1074,8 @@ def update_trashcan(trashcan_id: int, payload: TrashCanUpdate, db: Session = Dep
     if payload.is_online is not None:
         trashcan.is_online = payload.is_online
 
-    db.commit()
+    await db.commit()
+    invalidate_response_cache()
     return {
         "updated": True,
         "trashcan_id": trashcan.trashcan_id,
@@ -506,38 +1090,42 @@ def update_trashcan(trashcan_id: int, payload: TrashCanUpdate, db: Session = Dep
 
 
 @app.post("/trashcans/{trashcan_id}")
-def update_trashcan_post(trashcan_id: int, payload: TrashCanUpdate, db: Session = Depends(get_db)) -> dict:
+async def update_trashcan_post(
+    trashcan_id: int, payload: TrashCanUpdate, db: AsyncSession = Depends(get_async_db)
+) -> dict:
     """쓰레기통 수정 (POST 지원)."""
 
-    return update_trashcan(trashcan_id, payload, db)
+    return await update_trashcan(trashcan_id, payload, db)
 
 
 @app.delete("/trashcans/{trashcan_id}")
-def delete_trashcan(trashcan_id: int, db: Session = Depends(get_db)) -> dict:
+async def delete_trashcan(trashcan_id: int, db: AsyncSession = Depends(get_async_db)) -> dict:
     """쓰레기통 삭제(소프트 삭제)."""
 
-    trashcan = db.query(TrashCan).filter(TrashCan.trashcan_id == trashcan_id).one_or_none()
+    trashcan = await db.get(TrashCan, trashcan_id)
     if not trashcan:
         return {"deleted": False, "reason": "not_found"}
     if trashcan.is_deleted:
         return {"deleted": True, "already_deleted": True}
     trashcan.is_deleted = True
     trashcan.is_online = False
-    db.commit()
+    await db.commit()
+    invalidate_response_cache()
     return {"deleted": True, "soft_deleted": True}
 
 
 @app.post("/trashcans/{trashcan_id}/restore")
-def restore_trashcan(trashcan_id: int, db: Session = Depends(get_db)) -> dict:
+async def restore_trashcan(trashcan_id: int, db: AsyncSession = Depends(get_async_db)) -> dict:
     """쓰레기통 복구(소프트 삭제 복구)."""
 
-    trashcan = db.query(TrashCan).filter(TrashCan.trashcan_id == trashcan_id).one_or_none()
+    trashcan = await db.get(TrashCan, trashcan_id)
     if not trashcan:
         return {"restored": False, "reason": "not_found"}
     if not trashcan.is_deleted:
         return {"restored": True, "already_active": True}
     trashcan.is_deleted = False
-    db.commit()
+    await db.commit()
+    invalidate_response_cache()
     return {"restored": True}
 
 
@@ -551,51 +1139,45 @@ def trashcan_summary(
 ) -> dict:
     """쓰레기통별 종류 통계 및 여유공간 요약."""
 
-    def compute_status(current: Optional[int]) -> str:
-        if current is None:
-            return "unknown"
-        if current >= full_threshold:
-            return "full"
-        if current >= medium_threshold:
-            return "medium"
-        return "low"
-
-    trashcan = (
-        db.query(TrashCan)
-        .filter(TrashCan.trashcan_id == trashcan_id, TrashCan.is_deleted.is_(False))
-        .one_or_none()
-    )
+    # lambda_stmt: 구문 구성/컴파일 결과를 람다 위치 기준으로 캐시하고
+    # 클로저 변수(trashcan_id, cutoff)만 매 요청 바인드 파라미터로 전달
+    trashcan = db.execute(
+        lambda_stmt(
+            lambda: select(
+                TrashCan.trashcan_id,
+                TrashCan.trashcan_name,
+                TrashCan.trashcan_city,
+                TrashCan.address_detail,
+                TrashCan.is_online,
+                TrashCan.last_connected_at,
+                TrashCan.trashcan_capacity,
+            ).where(TrashCan.trashcan_id == trashcan_id, TrashCan.is_deleted.is_(False))
+        )
+    ).one_or_none()
     if not trashcan:
         return {"ok": False, "reason": "not_found"}
 
-    total_objects = (
-        db.query(func.count(DetectionDetail.detail_id))
-        .join(Detection, DetectionDetail.detection_id == Detection.detection_id)
-        .filter(Detection.trashcan_id == trashcan_id)
-        .scalar()
-        or 0
-    )
-    cutoff = datetime.utcnow() - timedelta(days=window_days)
-    current_objects = (
-        db.query(func.count(DetectionDetail.detail_id))
-        .join(Detection, DetectionDetail.detection_id == Detection.detection_id)
-        .filter(Detection.trashcan_id == trashcan_id, Detection.detected_at >= cutoff)
-        .scalar()
-        or 0
-    )
+    # 종류별 전체/기간 내 탐지 수를 한 번에 집계한 뒤 합계를 계산
+    cutoff = _utcnow() - timedelta(days=window_days)
+    type_rows = db.execute(
+        lambda_stmt(
+            lambda: select(
+                WasteType.type_name,
+                func.count(DetectionDetail.detail_id),
+                func.count(case((Detection.detected_at >= cutoff, DetectionDetail.detail_id))),
+            )
+            .join(DetectionDetail, WasteType.waste_type_id == DetectionDetail.waste_type_id)
+            .join(Detection, DetectionDetail.detection_id == Detection.detection_id)
+            .where(Detection.trashcan_id == trashcan_id)
+            .group_by(WasteType.type_name)
+        )
+    ).all()
+    total_objects = sum(total for _, total, _ in type_rows)
+    current_objects = sum(current for _, _, current in type_rows)
     capacity_remaining = None
     if trashcan.trashcan_capacity is not None:
         capacity_remaining = trashcan.trashcan_capacity - current_objects
 
-    type_rows = (
-        db.query(WasteType.type_name, func.count(DetectionDetail.detail_id))
-        .join(DetectionDetail, WasteType.waste_type_id == DetectionDetail.waste_type_id)
-        .join(Detection, DetectionDetail.detection_id == Detection.detection_id)
-        .filter(Detection.trashcan_id == trashcan_id)
-        .group_by(WasteType.type_name)
-        .all()
-    )
-
     return {
         "trashcan_id": trashcan.trashcan_id,
         "trashcan_name": trashcan.trashcan_name,
@@ -606,28 +1188,26 @@ def trashcan_summary(
         "total_objects": total_objects,
         "current_objects": current_objects,
         "capacity_remaining": capacity_remaining,
-        "status": compute_status(current_objects),
-        "by_type": {name: count for name, count in type_rows},
+        "status": compute_status(current_objects, full_threshold, medium_threshold),
+        "by_type": {name: total for name, total, _ in type_rows},
     }
 
 
 @app.post("/trashcans/{trashcan_id}/connection-test")
-def trashcan_connection_test(trashcan_id: int, db: Session = Depends(get_db)) -> dict:
+async def trashcan_connection_test(trashcan_id: int, db: AsyncSession = Depends(get_async_db)) -> dict:
     """쓰레기통 연결 상태 점검(현재 상태 기반)."""
 
-    trashcan = (
-        db.query(TrashCan)
-        .filter(TrashCan.trashcan_id == trashcan_id, TrashCan.is_deleted.is_(False))
-        .one_or_none()
+    trashcan = await db.scalar(
+        select(TrashCan).where(TrashCan.trashcan_id == trashcan_id, TrashCan.is_deleted.is_(False))
     )
     if not trashcan:
         return {"ok": False, "reason": "not_found"}
 
-    tested_at = datetime.utcnow()
+    tested_at = _utcnow()
     result = "online" if trashcan.is_online else "offline"
     if trashcan.is_online:
         trashcan.last_connected_at = tested_at
-        db.commit()
+        await db.commit()
     return {
         "trashcan_id": trashcan.trashcan_id,
         "is_online": trashcan.is_online,
@@ -642,9 +1222,10 @@ def detection_details(
     waste_type: str = Query("전체"),
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 offset 무시)"),
     db: Session = Depends(get_db),
-) -> dict:
-    """쓰레기 종류별 상세(사진/일시) 조회."""
+) -> Response:
+    """쓰레기 종류별 상세(사진/일시) 조회 (커서 또는 offset 기반 페이지네이션)."""
 
     key = (waste_type or "").strip().lower()
     type_map = {
@@ -672,12 +1253,24 @@ def detection_details(
         )
         .join(Detection, DetectionDetail.detection_id == Detection.detection_id)
         .join(WasteType, WasteType.waste_type_id == DetectionDetail.waste_type_id)
-        .order_by(Detection.detected_at.desc())
+        # 같은 시각의 상세도 순서가 고정되도록 detail_id를 함께 정렬
+        .order_by(Detection.detected_at.desc(), DetectionDetail.detail_id.desc())
     )
     if normalized:
         query = query.filter(func.lower(WasteType.type_name) == str(normalized).lower())
 
-    rows = query.offset(offset).limit(limit).all()
+    if cursor:
+        # 커서 위치 이후만 범위 조회 (깊은 페이지에서도 앞쪽 행을 건너뛰지 않음)
+        cursor_at, cursor_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                Detection.detected_at < cursor_at,
+                and_(Detection.detected_at == cursor_at, DetectionDetail.detail_id < cursor_id),
+            )
+        )
+    else:
+        query = query.offset(offset)
+    rows = query.limit(limit).all()
     items = []
     for detail_id, type_name, image_name, image_path, detected_at, trashcan_id in rows:
         items.append(
@@ -690,141 +1283,126 @@ def detection_details(
                 "trashcan_id": trashcan_id,
             }
         )
-    return {"items": items}
+    next_cursor = None
+    if len(rows) == limit:
+        next_cursor = encode_cursor(rows[-1].detected_at, rows[-1].detail_id)
+    return ORJSONResponse(content={"items": items, "next_cursor": next_cursor})
 
 
 @app.post("/waste-types")
-def create_waste_type(payload: WasteTypeIn, db: Session = Depends(get_db)) -> dict:
+async def create_waste_type(payload: WasteTypeIn, db: AsyncSession = Depends(get_async_db)) -> dict:
     """쓰레기 종류 등록."""
 
-    existing = db.query(WasteType).filter(WasteType.type_name == payload.type_name).one_or_none()
+    existing = await db.scalar(select(WasteType).where(WasteType.type_name == payload.type_name))
     if existing:
         return {"waste_type_id": existing.waste_type_id, "type_name": existing.type_name}
     waste_type = WasteType(type_name=payload.type_name)
     db.add(waste_type)
-    db.commit()
-    db.refresh(waste_type)
+    await db.commit()
     return {"waste_type_id": waste_type.waste_type_id, "type_name": waste_type.type_name}
 
 
 @app.delete("/waste-types/{waste_type_id}")
-def delete_waste_type(waste_type_id: int, db: Session = Depends(get_db)) -> dict:
+async def delete_waste_type(waste_type_id: int, db: AsyncSession = Depends(get_async_db)) -> dict:
     """쓰레기 종류 삭제."""
 
-    waste_type = db.query(WasteType).filter(WasteType.waste_type_id == waste_type_id).one_or_none()
+    waste_type = await db.get(WasteType, waste_type_id)
     if not waste_type:
         return {"deleted": False, "reason": "not_found"}
-    if waste_type.detection_details:
+    # 상세 목록 전체를 지연 로딩하지 않고 존재 여부만 확인
+    in_use = await db.scalar(select(exists().where(DetectionDetail.waste_type_id == waste_type_id)))
+    if in_use:
         return {"deleted": False, "reason": "in_use"}
-    db.delete(waste_type)
-    db.commit()
+    await db.delete(waste_type)
+    await db.commit()
+    for class_id, cached_id in list(_waste_type_cache.items()):
+        if cached_id == waste_type_id:
+            del _waste_type_cache[class_id]
     return {"deleted": True}
 
 
 @app.post("/waste-types/seed")
-def seed_waste_types(
+async def seed_waste_types(
     types: List[str] = Query(..., description="쉼표 없이 여러 번 전달"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> dict:
     """쓰레기 종류 초기 데이터 등록."""
 
-    created = 0
-    skipped = 0
-    for name in types:
-        exists = db.query(WasteType).filter(WasteType.type_name == name).one_or_none()
-        if exists:
-            skipped += 1
-            continue
-        db.add(WasteType(type_name=name))
-        created += 1
-    db.commit()
-    return {"created": created, "skipped": skipped}
+    # 이미 있는 이름을 한 번에 조회한 뒤 없는 이름만 다중 행 INSERT 한 번으로 저장
+    existing = set(await db.scalars(select(WasteType.type_name).where(WasteType.type_name.in_(types))))
+    missing = [name for name in dict.fromkeys(types) if name not in existing]
+    if missing:
+        # 동시 요청이 먼저 생성한 이름은 중복 키로 무시 (INSERT IGNORE와 달리 다른 오류는 그대로 발생)
+        stmt = mysql_insert(WasteType).values([{"type_name": name} for name in missing])
+        await db.execute(stmt.on_duplicate_key_update(type_name=stmt.inserted.type_name))
+    await db.commit()
+    return {"created": len(missing), "skipped": len(types) - len(missing)}
 
 
 @app.get("/dashboard/summary")
-def dashboard_summary(db: Session = Depends(get_db)) -> dict:
-    """전체 쓰레기 수 및 유형별 집계."""
-
-    total_objects = db.query(func.count(DetectionDetail.detail_id)).scalar() or 0
-    total_events = db.query(func.count(Detection.detection_id)).scalar() or 0
-    type_rows = (
-        db.query(WasteType.type_name, func.count(DetectionDetail.detail_id))
-        .join(DetectionDetail, WasteType.waste_type_id == DetectionDetail.waste_type_id)
-        .group_by(WasteType.type_name)
-        .all()
+def dashboard_summary(request: Request, db: Session = Depends(get_db)) -> Response:
+    """전체 쓰레기 수 및 유형별 집계 (RESPONSE_CACHE_TTL_SECONDS 동안 캐시)."""
+
+    cached = get_cached_response(request)
+    if cached is not None:
+        return cached
+
+    total_events = db.scalar(_Q_TOTAL_EVENTS) or 0
+    by_type = {name: count for name, count in db.execute(_Q_TYPE_COUNTS)}
+    # 모든 상세는 종류를 가지므로 종류별 합계가 전체 객체 수
+    return cache_response(
+        request,
+        {
+            "total_objects": sum(by_type.values()),
+            "total_events": total_events,
+            "by_type": by_type,
+        },
     )
-    return {
-        "total_objects": total_objects,
-        "total_events": total_events,
-        "by_type": {name: count for name, count in type_rows},
-    }
 
 
 @app.get("/dashboard/summary/trashcans")
-def dashboard_summary_by_trashcan(db: Session = Depends(get_db)) -> dict:
-    """쓰레기통별 요약 집계."""
-
-    events_rows = (
-        db.query(Detection.trashcan_id, func.count(Detection.detection_id))
-        .group_by(Detection.trashcan_id)
-        .all()
-    )
-    objects_rows = (
-        db.query(Detection.trashcan_id, func.count(DetectionDetail.detail_id))
-        .join(DetectionDetail, DetectionDetail.detection_id == Detection.detection_id)
-        .group_by(Detection.trashcan_id)
-        .all()
-    )
-    type_rows = (
-        db.query(Detection.trashcan_id, WasteType.type_name, func.count(DetectionDetail.detail_id))
-        .join(DetectionDetail, DetectionDetail.detection_id == Detection.detection_id)
-        .join(WasteType, WasteType.waste_type_id == DetectionDetail.waste_type_id)
-        .group_by(Detection.trashcan_id, WasteType.type_name)
-        .all()
-    )
-
-    items_map: Dict[int, Dict] = {}
-    for trashcan_id, count in events_rows:
-        items_map.setdefault(trashcan_id, {"total_events": 0, "total_objects": 0, "by_type": {}})
-        items_map[trashcan_id]["total_events"] = count
-    for trashcan_id, count in objects_rows:
-        items_map.setdefault(trashcan_id, {"total_events": 0, "total_objects": 0, "by_type": {}})
-        items_map[trashcan_id]["total_objects"] = count
-    for trashcan_id, type_name, count in type_rows:
-        items_map.setdefault(trashcan_id, {"total_events": 0, "total_objects": 0, "by_type": {}})
-        items_map[trashcan_id]["by_type"][type_name] = count
-
-    trashcans = db.query(TrashCan).filter(TrashCan.is_deleted.is_(False)).all()
-    items = []
-    for trashcan in trashcans:
-        summary = items_map.get(
-            trashcan.trashcan_id,
-            {"total_events": 0, "total_objects": 0, "by_type": {}},
-        )
-        items.append(
-            {
-                "trashcan_id": trashcan.trashcan_id,
-                "trashcan_name": trashcan.trashcan_name,
-                "trashcan_city": trashcan.trashcan_city,
-                "total_events": summary["total_events"],
-                "total_objects": summary["total_objects"],
-                "by_type": summary["by_type"],
-            }
-        )
+def dashboard_summary_by_trashcan(request: Request, db: Session = Depends(get_db)) -> Response:
+    """쓰레기통별 요약 집계 (RESPONSE_CACHE_TTL_SECONDS 동안 캐시)."""
+
+    cached = get_cached_response(request)
+    if cached is not None:
+        return cached
+
+    # 정렬된 결과를 한 번 훑으며 쓰레기통 단위로 묶음
+    items: List[Dict[str, Any]] = []
+    for trashcan_id, name, city, events, objects, type_name, type_count in db.execute(_Q_TRASHCAN_SUMMARY):
+        if not items or items[-1]["trashcan_id"] != trashcan_id:
+            items.append(
+                {
+                    "trashcan_id": trashcan_id,
+                    "trashcan_name": name,
+                    "trashcan_city": city,
+                    "total_events": events,
+                    "total_objects": objects,
+                    "by_type": {},
+                }
+            )
+        if type_name is not None:
+            items[-1]["by_type"][type_name] = type_count
 
-    return {"items": items}
+    return cache_response(request, {"items": items})
 
 
 @app.get("/dashboard/stats")
 def dashboard_stats(
+    request: Request,
     period: str = Query("week", pattern="^(week|month|year)$"),
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     db: Session = Depends(get_db),
-) -> dict:
-    """주간/월간/연간 통계 조회."""
+) -> Response:
+    """주간/월간/연간 통계 조회 (RESPONSE_CACHE_TTL_SECONDS 동안 캐시)."""
+
+    cached = get_cached_response(request)
+    if cached is not None:
+        return cached
 
-    today = datetime.utcnow().date()
+    today = _utcnow().date()
     if start_date and end_date:
         start = start_date
         end = end_date
@@ -839,67 +1417,75 @@ def dashboard_stats(
         end = today
         response_period = period
 
-    start_dt = datetime.combine(start, datetime.min.time())
-    end_dt = datetime.combine(end, datetime.max.time())
-
-    total_events = (
-        db.query(func.count(Detection.detection_id))
-        .filter(Detection.detected_at.between(start_dt, end_dt))
-        .scalar()
-        or 0
-    )
-    total_objects = (
-        db.query(func.count(DetectionDetail.detail_id))
-        .join(Detection, DetectionDetail.detection_id == Detection.detection_id)
-        .filter(Detection.detected_at.between(start_dt, end_dt))
-        .scalar()
-        or 0
-    )
-    type_rows = (
-        db.query(WasteType.type_name, func.count(DetectionDetail.detail_id))
-        .join(DetectionDetail, WasteType.waste_type_id == DetectionDetail.waste_type_id)
-        .join(Detection, DetectionDetail.detection_id == Detection.detection_id)
-        .filter(Detection.detected_at.between(start_dt, end_dt))
-        .group_by(WasteType.type_name)
-        .all()
-    )
-    city_rows = (
-        db.query(TrashCan.trashcan_city, func.count(DetectionDetail.detail_id))
-        .join(Detection, Detection.trashcan_id == TrashCan.trashcan_id)
-        .join(DetectionDetail, DetectionDetail.detection_id == Detection.detection_id)
-        .filter(Detection.detected_at.between(start_dt, end_dt))
-        .group_by(TrashCan.trashcan_city)
-        .all()
+    start_dt = datetime.combine(start, _T_MIN)
+    end_dt = datetime.combine(end, _T_MAX)
+
+    total_events = db.scalar(_Q_PERIOD_EVENTS, {"start_dt": start_dt, "end_dt": end_dt}) or 0
+
+    # 갱신이 끝난 날짜(스케줄러 대상일 이전)는 DailyStats에서 읽음
+    group_rows = []
+    stats_params = {"stats_start": start, "stats_end": min(end, today - timedelta(days=STATS_LAG_DAYS + 1))}
+    covered = set()
+    if stats_params["stats_start"] <= stats_params["stats_end"]:
+        covered = set(db.scalars(_Q_STATS_DATES, stats_params))
+        if covered:
+            group_rows.extend(db.execute(_Q_STATS_GROUPS, stats_params))
+    # 나머지 날짜(최근/통계 없음)는 원본 테이블에서 연속 구간별로 집계
+    spans = uncovered_spans(start, end, covered)
+    if spans:
+        group_rows.extend(
+            db.execute(
+                _Q_LIVE_GROUPS.where(
+                    or_(
+                        *(
+                            and_(
+                                Detection.detected_at >= datetime.combine(span_start, _T_MIN),
+                                Detection.detected_at < datetime.combine(span_end, _T_MIN),
+                            )
+                            for span_start, span_end in spans
+                        )
+                    )
+                )
+            )
+        )
+    # 도시 x 종류 집계로 종류별/도시별/전체 객체 수를 함께 계산
+    by_type: Dict[str, int] = {}
+    by_city: Dict[Optional[str], int] = {}
+    for city, type_name, count in group_rows:
+        # MySQL의 SUM 결과(DECIMAL)도 정수로 통일
+        count = int(count)
+        by_type[type_name] = by_type.get(type_name, 0) + count
+        by_city[city] = by_city.get(city, 0) + count
+
+    return cache_response(
+        request,
+        {
+            "period": response_period,
+            "start_date": start,
+            "end_date": end,
+            "total_events": total_events,
+            "total_objects": sum(by_type.values()),
+            "by_type": by_type,
+            "by_city": by_city,
+        }
     )
 
-    return {
-        "period": response_period,
-        "start_date": start,
-        "end_date": end,
-        "total_events": total_events,
-        "total_objects": total_objects,
-        "by_type": {name: count for name, count in type_rows},
-        "by_city": {city: count for city, count in city_rows},
-    }
-
 
 @app.delete("/daily-stats")
-def delete_daily_stats(
+async def delete_daily_stats(
     start_date: date = Query(...),
     end_date: date = Query(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> dict:
     """일별 통계 삭제(기간별)."""
 
     if start_date > end_date:
         raise HTTPException(status_code=400, detail="start_date must be <= end_date")
 
-    deleted = (
-        db.query(DailyStats)
-        .filter(DailyStats.stats_date.between(start_date, end_date))
-        .delete(synchronize_session=False)
-    )
-    db.commit()
+    result = await db.execute(delete(DailyStats).where(DailyStats.stats_date.between(start_date, end_date)))
+    deleted = result.rowcount
+    await db.commit()
+    invalidate_response_cache()
     return {"deleted": deleted, "start_date": start_date, "end_date": end_date}
 
 
@@ -914,48 +1500,42 @@ def rebuild_daily_stats(
         raise HTTPException(status_code=400, detail="start_date must be <= end_date")
 
     refresh_daily_stats_range(start_date, end_date)
+    invalidate_response_cache()
     return {"rebuilt": True, "start_date": start_date, "end_date": end_date}
 
 
 @app.delete("/detections")
-def delete_detections(
+async def delete_detections(
     start_date: date = Query(...),
     end_date: date = Query(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> dict:
     """탐지 데이터 삭제(기간별, Detection/DetectionDetail)."""
 
     if start_date > end_date:
         raise HTTPException(status_code=400, detail="start_date must be <= end_date")
 
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date, datetime.max.time())
+    start_dt = datetime.combine(start_date, _T_MIN)
+    end_dt = datetime.combine(end_date, _T_MAX)
 
-    detection_ids = (
-        db.query(Detection.detection_id)
-        .filter(Detection.detected_at.between(start_dt, end_dt))
-        .all()
+    result = await db.scalars(
+        select(Detection.detection_id).where(Detection.detected_at.between(start_dt, end_dt))
     )
-    detection_ids = [row[0] for row in detection_ids]
+    detection_ids = result.all()
     if not detection_ids:
         return {"deleted_detections": 0, "deleted_details": 0, "start_date": start_date, "end_date": end_date}
 
     deleted_details = (
-        db.query(DetectionDetail)
-        .filter(DetectionDetail.detection_id.in_(detection_ids))
-        .delete(synchronize_session=False)
-    )
+        await db.execute(delete(DetectionDetail).where(DetectionDetail.detection_id.in_(detection_ids)))
+    ).rowcount
     deleted_detections = (
-        db.query(Detection)
-        .filter(Detection.detection_id.in_(detection_ids))
-        .delete(synchronize_session=False)
-    )
+        await db.execute(delete(Detection).where(Detection.detection_id.in_(detection_ids)))
+    ).rowcount
     deleted_daily_stats = (
-        db.query(DailyStats)
-        .filter(DailyStats.stats_date.between(start_date, end_date))
-        .delete(synchronize_session=False)
-    )
-    db.commit()
+        await db.execute(delete(DailyStats).where(DailyStats.stats_date.between(start_date, end_date)))
+    ).rowcount
+    await db.commit()
+    invalidate_response_cache()
     return {
         "deleted_detections": deleted_detections,
         "deleted_details": deleted_details,
@@ -966,42 +1546,35 @@ def delete_detections(
 
 
 @app.delete("/detections/recent")
-def delete_recent_detections(
+async def delete_recent_detections(
     days: int = Query(..., ge=1, le=3650),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> dict:
     """최근 N일 탐지 데이터 삭제(오늘 포함)."""
 
-    end_date = datetime.utcnow().date()
+    end_date = _utcnow().date()
     start_date = end_date - timedelta(days=days - 1)
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date, datetime.max.time())
+    start_dt = datetime.combine(start_date, _T_MIN)
+    end_dt = datetime.combine(end_date, _T_MAX)
 
-    detection_ids = (
-        db.query(Detection.detection_id)
-        .filter(Detection.detected_at.between(start_dt, end_dt))
-        .all()
+    result = await db.scalars(
+        select(Detection.detection_id).where(Detection.detected_at.between(start_dt, end_dt))
     )
-    detection_ids = [row[0] for row in detection_ids]
+    detection_ids = result.all()
     if not detection_ids:
         return {"deleted_detections": 0, "deleted_details": 0, "start_date": start_date, "end_date": end_date}
 
     deleted_details = (
-        db.query(DetectionDetail)
-        .filter(DetectionDetail.detection_id.in_(detection_ids))
-        .delete(synchronize_session=False)
-    )
+        await db.execute(delete(DetectionDetail).where(DetectionDetail.detection_id.in_(detection_ids)))
+    ).rowcount
     deleted_detections = (
-        db.query(Detection)
-        .filter(Detection.detection_id.in_(detection_ids))
-        .delete(synchronize_session=False)
-    )
+        await db.execute(delete(Detection).where(Detection.detection_id.in_(detection_ids)))
+    ).rowcount
     deleted_daily_stats = (
-        db.query(DailyStats)
-        .filter(DailyStats.stats_date.between(start_date, end_date))
-        .delete(synchronize_session=False)
-    )
-    db.commit()
+        await db.execute(delete(DailyStats).where(DailyStats.stats_date.between(start_date, end_date)))
+    ).rowcount
+    await db.commit()
+    invalidate_response_cache()
     return {
         "deleted_detections": deleted_detections,
         "deleted_details": deleted_details,
@@ -1013,82 +1586,85 @@ def delete_recent_detections(
 
 @app.get("/trashcans/collection-needed")
 def collection_needed(
+    request: Request,
     status: Optional[str] = Query(None, pattern="^(full|medium|low|unknown)$"),
     sort: str = Query("status", pattern="^(status|count)$"),
     window_days: int = Query(7, ge=1, le=365), # 수거 필요 쓰레기통 조회 기간 ex.최근 7일간 발생한 탐지횟수 통해 상태 계산
     # 쓰레기통 상태 계산 임계값
     full_threshold: int = Query(50, ge=1), # 포화 임계값
     medium_threshold: int = Query(20, ge=1), # 보통 임계값
+    limit: Optional[int] = Query(None, ge=1, le=1000), # 정렬 순서 기준 상위 N개만 조회
     db: Session = Depends(get_db),
-) -> dict:
-    """탐지 이벤트 기반 수거 필요 쓰레기통 조회."""
-
-    def compute_status(current: Optional[int]) -> str:
-        if current is None:
-            return "unknown"
-        if current >= full_threshold:
-            return "full"
-        if current >= medium_threshold:
-            return "medium"
-        return "low"
-
-    cutoff = datetime.utcnow() - timedelta(days=window_days)
-    volume_rows = (
-        db.query(Detection.trashcan_id, func.count(DetectionDetail.detail_id))
+) -> Response:
+    """탐지 이벤트 기반 수거 필요 쓰레기통 조회 (RESPONSE_CACHE_TTL_SECONDS 동안 캐시)."""
+
+    cached = get_cached_response(request)
+    if cached is not None:
+        return cached
+
+    cutoff = _utcnow() - timedelta(days=window_days)
+    volumes = (
+        db.query(Detection.trashcan_id, func.count(DetectionDetail.detail_id).label("cnt"))
         .join(DetectionDetail, DetectionDetail.detection_id == Detection.detection_id)
         .filter(Detection.detected_at >= cutoff)
         .group_by(Detection.trashcan_id)
-        .all()
+        .subquery()
     )
-    volume_map = {trashcan_id: count for trashcan_id, count in volume_rows}
+    # 기간 내 탐지가 없는 쓰레기통은 cnt가 NULL (상태 unknown)
+    current_volume = volumes.c.cnt
+    state = status_case(current_volume, full_threshold, medium_threshold)
 
-    rows = db.query(TrashCan).filter(TrashCan.is_deleted.is_(False)).all()
-    result = []
-    for row in rows:
-        current_volume = volume_map.get(row.trashcan_id)
-        state = compute_status(current_volume)
-        if status and state != status:
-            continue
-        result.append(
-            {
-                "trashcan_id": row.trashcan_id,
-                "trashcan_name": row.trashcan_name,
-                "trashcan_city": row.trashcan_city,
-                "detection_count": current_volume,
-                "status": state,
-                "window_days": window_days,
-                "full_threshold": full_threshold,
-                "medium_threshold": medium_threshold,
-            }
-        )
-
-    status_order = {"full": 0, "medium": 1, "low": 2, "unknown": 3}
+    # 상태 계산/필터/정렬을 모두 SQL에서 처리
+    query = (
+        db.query(TrashCan.trashcan_id, TrashCan.trashcan_name, TrashCan.trashcan_city, current_volume, state)
+        .outerjoin(volumes, volumes.c.trashcan_id == TrashCan.trashcan_id)
+        .filter(TrashCan.is_deleted.is_(False))
+    )
+    if status:
+        query = query.filter(state == status)
     if sort == "count":
-        result.sort(key=lambda item: (item["detection_count"] is None, -(item["detection_count"] or 0)))
+        query = query.order_by(
+            current_volume.is_(None), func.coalesce(current_volume, 0).desc(), TrashCan.trashcan_id
+        )
     else:
-        result.sort(
-            key=lambda item: (
-                status_order.get(item["status"], 9),
-                -(item["detection_count"] or 0),
-            )
+        query = query.order_by(
+            status_rank(current_volume, full_threshold, medium_threshold),
+            func.coalesce(current_volume, 0).desc(),
+            TrashCan.trashcan_id,
         )
-    return {"items": result}
+    if limit is not None:
+        query = query.limit(limit)
+    result = [
+        {
+            "trashcan_id": trashcan_id,
+            "trashcan_name": trashcan_name,
+            "trashcan_city": trashcan_city,
+            "detection_count": detection_count,
+            "status": row_status,
+            "window_days": window_days,
+            "full_threshold": full_threshold,
+            "medium_threshold": medium_threshold,
+        }
+        for trashcan_id, trashcan_name, trashcan_city, detection_count, row_status in query
+    ]
+    return cache_response(request, {"items": result})
 
 
 @app.get("/trashcans/offline")
 def offline_trashcans(
+    request: Request,
     stale_hours: int = Query(24, ge=1, le=168),
     db: Session = Depends(get_db),
-) -> dict:
-    """미연결 쓰레기통 및 간단 에러 상태 확인."""
+) -> Response:
+    """미연결 쓰레기통 및 간단 에러 상태 확인 (RESPONSE_CACHE_TTL_SECONDS 동안 캐시)."""
 
-    now = datetime.utcnow()
+    cached = get_cached_response(request)
+    if cached is not None:
+        return cached
+
+    now = _utcnow()
     cutoff = now - timedelta(hours=stale_hours)
-    rows = (
-        db.query(TrashCan)
-        .filter(TrashCan.is_online.is_(False), TrashCan.is_deleted.is_(False))
-        .all()
-    )
+    rows = db.execute(_Q_OFFLINE).all()
     items = []
     for row in rows:
         if row.last_connected_at is None:
@@ -1106,4 +1682,4 @@ def offline_trashcans(
                 "error_reason": reason,
             }
         )
-    return {"items": items}
+    return cache_response(request, {"items": items})
@@ -3,14 +3,15 @@
 """
 
 from sqlalchemy import (
-    JSON,
     BigInteger,
     Boolean,
     Column,
     DateTime,
     Date,
+    Double,
+    Float,
+    Index,
     Integer,
-    Numeric,
     String,
     ForeignKey,
 )
@@ -24,14 +25,17 @@ class TrashCan(Base):
     """쓰레기통 기본 정보 및 현재 상태."""
 
     __tablename__ = "TrashCan"
+    # 지도 영역(bbox) 조회용
+    __table_args__ = (Index("ix_tc_lat_lng", "trashcan_latitude", "trashcan_longitude"),)
 
     trashcan_id = Column(BigInteger, primary_key=True, autoincrement=True)
     trashcan_name = Column(String(255))
     trashcan_capacity = Column(Integer)
     trashcan_city = Column(String(100))
     address_detail = Column(String(255))
-    trashcan_latitude = Column(Numeric(10, 8))
-    trashcan_longitude = Column(Numeric(11, 8))
+    # GPS 좌표는 DOUBLE로 충분 (고정 8바이트, Decimal 변환 없음)
+    trashcan_latitude = Column(Double)
+    trashcan_longitude = Column(Double)
     is_online = Column(Boolean, default=False)
     last_connected_at = Column(DateTime)
     is_deleted = Column(Boolean, default=False)
@@ -55,12 +59,14 @@ class Detection(Base):
     """탐지 이벤트(이미지 단위)."""
 
     __tablename__ = "Detection"
+    # 쓰레기통별 기간 집계를 인덱스만으로 처리
+    __table_args__ = (Index("ix_det_trashcan_time", "trashcan_id", "detected_at"),)
 
     detection_id = Column(BigInteger, primary_key=True, autoincrement=True)
     trashcan_id = Column(BigInteger, ForeignKey("TrashCan.trashcan_id"), nullable=False, index=True)
     image_name = Column(String(255))
     image_path = Column(String(512))
-    detected_at = Column(DateTime, default=func.now(), nullable=False)
+    detected_at = Column(DateTime, default=func.now(), nullable=False, index=True)
     object_count = Column(Integer)
 
     trashcan = relationship("TrashCan", back_populates="detections")
@@ -71,12 +77,18 @@ class DetectionDetail(Base):
     """탐지 상세 결과(개별 객체)."""
 
     __tablename__ = "Detection_detail"
+    # 이벤트 조인 후 종류별 집계 (InnoDB 보조 인덱스는 PK(detail_id)를 포함하므로 커버링)
+    __table_args__ = (Index("ix_dd_detection_wastetype", "detection_id", "waste_type_id"),)
 
     detail_id = Column(BigInteger, primary_key=True, autoincrement=True)
     detection_id = Column(BigInteger, ForeignKey("Detection.detection_id"), nullable=False, index=True)
     waste_type_id = Column(BigInteger, ForeignKey("WasteType.waste_type_id"), nullable=False, index=True)
-    confidence = Column(Numeric(5, 4))
-    bbox_info = Column(JSON)
+    confidence = Column(Float)
+    # 바운딩 박스 좌표 (JSON 대신 숫자 컬럼으로 저장해 행 크기/파싱 비용 감소)
+    bbox_x1 = Column(Double)
+    bbox_y1 = Column(Double)
+    bbox_x2 = Column(Double)
+    bbox_y2 = Column(Double)
 
     detection = relationship("Detection", back_populates="details")
     waste_type = relationship("WasteType", back_populates="detection_details")